@@ -0,0 +1,130 @@
+"""
+Offline LLM processing via the OpenAI Batch API.
+
+For ingestion jobs that don't need interactive responses, the Batch API
+halves token cost and runs at a much higher provider-side concurrency
+ceiling in exchange for a completion window of up to 24 hours.
+"""
+
+import asyncio
+import io
+
+import orjson
+from loguru import logger
+
+from backend.content.content_processor import (
+    JSON_RESPONSE_FORMAT,
+    TEXT_LIMIT,
+    get_openai_client,
+)
+from backend.content.prompts import get_prompts
+
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL_SECONDS = 30
+
+
+def submit_batch(scrape_results: list) -> str:
+    """
+    Submit scraped pages as an OpenAI batch job.
+
+    Builds one chat-completion request per successful scrape (keyed by
+    URL via custom_id), uploads them as a JSONL batch file and creates
+    the batch.
+
+    Args:
+        scrape_results (list): scrape_url result dicts
+
+    Returns:
+        str: The batch id to poll with poll_batch
+    """
+    lines = []
+    for scrape_result in scrape_results:
+        if not scrape_result.get("success"):
+            continue
+        system_prompt, user_prompt = get_prompts(
+            headings_subset=scrape_result["information"]["headings"],
+            limited_text=scrape_result["information"]["all_text"][:TEXT_LIMIT],
+        )
+        lines.append(
+            orjson.dumps(
+                {
+                    "custom_id": scrape_result["url"],
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": "gpt-3.5-turbo",
+                        "messages": [
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": user_prompt},
+                        ],
+                        "response_format": JSON_RESPONSE_FORMAT,
+                    },
+                }
+            )
+        )
+
+    if not lines:
+        raise ValueError("No successful scrape results to submit")
+
+    client = get_openai_client()
+    batch_file = client.files.create(
+        file=io.BytesIO(b"\n".join(lines)), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+    logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+    return batch.id
+
+
+async def poll_batch(
+    batch_id: str, poll_interval: int = BATCH_POLL_INTERVAL_SECONDS
+) -> dict:
+    """
+    Wait for a batch job to finish and collect its results.
+
+    Args:
+        batch_id (str): The id returned by submit_batch
+        poll_interval (int): Seconds to sleep between status checks
+
+    Returns:
+        dict: Mapping of URL to the cleaned LLM result (None on failure);
+              empty if the batch did not complete
+    """
+    client = get_openai_client()
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in ("completed", "failed", "expired", "cancelled"):
+            break
+        await asyncio.sleep(poll_interval)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        logger.error(f"Batch {batch_id} finished with status: {batch.status}")
+        return {}
+
+    results = {}
+    output = client.files.content(batch.output_file_id).content
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        # Failed requests carry "response": null with the error populated;
+        # don't let one bad record discard the rest of the batch
+        response = record.get("response")
+        if not response:
+            logger.error(
+                f"Batch request {record.get('custom_id')} failed: {record.get('error')}"
+            )
+            results[record["custom_id"]] = None
+            continue
+        llm_response = response["body"]["choices"][0]["message"]["content"]
+        try:
+            results[record["custom_id"]] = orjson.loads(
+                llm_response.replace("```json", "").replace("```", "").strip()
+            )
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Error parsing batch result as JSON: {str(e)}")
+            results[record["custom_id"]] = None
+    return results
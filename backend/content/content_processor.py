@@ -10,38 +10,158 @@ Key features:
 Essential for building a content ingestion pipeline that transforms raw web data into structured, searchable information.
 """
 
-import json
+import asyncio
+import hashlib
 import os
 import re
+from functools import lru_cache
+from urllib.parse import urlparse
 from uuid import UUID
 
-import requests
+import httpx
+import numpy as np
+import orjson
 from bs4 import BeautifulSoup
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from loguru import logger
 from openai import OpenAI
 
-from backend.content.prompts import get_prompts
+from backend.content.prompts import get_batch_prompts, get_prompts
 from backend.models.mongo.db_manager import MongoDBManager
 from backend.models.rag.qdrant import QdrantVectorStore
+from backend.models.rag.semantic_cache import SemanticCache
 from backend.services.vector_schemas import ContentProcessor
 
 TEXT_LIMIT = 6000
 HEADING_LIMIT = 6
+MAX_TEXT_CHARS = 64_000
+LLM_BATCH_SIZE = 4
+# Built once at import time; every LLM call ships this same structure
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+MAX_DOWNLOAD_BYTES = 512_000
+DOWNLOAD_CHUNK_SIZE = 16_384
 
 load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """
+    Process-wide chat-completions client, constructed on first use
+
+    Carries an explicit keep-alive pool so successive chat completions
+    reuse warm connections instead of paying a TLS handshake per request;
+    deferring construction keeps scrape-only imports of this module cheap.
+    """
+    return OpenAI(
+        api_key=OPENAI_API_KEY,
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        ),
+    )
+
+
+# Shared async HTTP client: scrapes no longer block the event loop and
+# repeat requests to the same host reuse warm keep-alive connections
+_http = httpx.AsyncClient(
+    timeout=10.0,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+)
+
+
+# Successful scrape results keyed by URL hash; repeat harvests within the
+# TTL skip the network and parse entirely
+_SCRAPE_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# Compiled once; scrape_url rejects non-HTTP inputs before any network
+# or cache work happens
+URL_RE = re.compile(r"^https?://")
+
+ALL_HEADING_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6"]
+
+# Heading levels actually observed per site, keyed by hostname, so repeat
+# scrapes of a known template only scan for the tags the site really uses
+_SITE_HEADING_TAGS: dict = {}
+
+
+# Extract headings, specializing the tag scan per site template
+def extract_headings(soup: BeautifulSoup, url: str) -> dict:
+    """
+    Extract headings from a parsed page.
+
+    On the first scrape of a host the full h1-h6 scan runs and the levels
+    that were actually present are cached; later scrapes of the same host
+    only search for those levels, falling back to the generic scan if the
+    template changed.
+
+    Args:
+        soup (BeautifulSoup): Parsed page
+        url (str): The URL the page came from
+
+    Returns:
+        dict: Headings bucketed by level (h1-h6)
+    """
+    headings = {level: [] for level in ALL_HEADING_TAGS}
+
+    netloc = urlparse(url).netloc
+    search_tags = _SITE_HEADING_TAGS.get(netloc, ALL_HEADING_TAGS)
+    tags = soup.find_all(search_tags)
+    if not tags and search_tags is not ALL_HEADING_TAGS:
+        # Site template changed since we cached it; rescan everything
+        tags = soup.find_all(ALL_HEADING_TAGS)
+
+    for tag in tags:
+        title = tag.get_text(strip=True)  # Get cleaned title content
+        level = tag.name  # Get heading level (h1-h6)
+
+        headings[level].append(title)
+
+    observed = [level for level in ALL_HEADING_TAGS if headings[level]]
+    if observed:
+        _SITE_HEADING_TAGS[netloc] = observed
+
+    return headings
+
+
+# Hash the URL and raw page body for cache lookups
+def compute_content_hash(url: str, body: bytes) -> str:
+    """
+    Compute a stable hash for a URL and its raw page content.
+
+    Args:
+        url (str): The source URL
+        body (bytes): The raw response body
+
+    Returns:
+        str: Hex digest identifying this (url, content) pair
+    """
+    body_digest = hashlib.sha256(body).digest()
+    return hashlib.blake2b(url.encode() + body_digest, digest_size=16).hexdigest()
 
 
 # Scrape the URL and return the text
-async def scrape_url(url: str) -> dict:
+async def scrape_url(
+    url: str,
+    max_text_chars: int = MAX_TEXT_CHARS,
+    max_download_bytes: int = MAX_DOWNLOAD_BYTES,
+) -> dict:
     """
     Scrapes a URL and returns the content with metadata.
 
+    The response body is streamed and the connection is closed once
+    max_download_bytes have arrived, so very long pages don't cost the
+    full download + parse when only the leading content is used.
+
     Args:
         url (str): The URL to scrape
+        max_text_chars (int): Cap on the extracted text length; anything
+            beyond it never enters the pipeline or MongoDB
+        max_download_bytes (int): Cap on how much of the response body is
+            downloaded before the connection is closed
 
     Returns:
         dict: {
@@ -52,39 +172,81 @@ async def scrape_url(url: str) -> dict:
         }
     """
     logger.info("starting to scrape URL")
-    try:
-        response = requests.get(url, timeout=10)
-
-        if response.status_code != 200:
-            logger.error(f"Failed to harvest URL {url}: {response.status_code}")
-            return {
-                "url": url,
-                "information": None,
-                "success": False,
-                "error": f"Failed to harvest URL: {url}",
-                "status_code": response.status_code,
-            }
-        soup = BeautifulSoup(response.text, "html.parser")
-        all_text = soup.get_text(separator=" ")
-        all_text = re.sub(r"\s+", " ", all_text)
-
-        # Initialize the headings dictionary with buckets for each heading level
-        headings = {"h1": [], "h2": [], "h3": [], "h4": [], "h5": [], "h6": []}
-
-        # Find all headings within the url
-        for tag in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
-            title = tag.get_text(strip=True)  # Get cleaned title content
-            level = tag.name  # Get heading level (h1-h6)
+    if not URL_RE.match(url):
+        logger.error(f"Not an http(s) URL: {url}")
+        return {
+            "url": url,
+            "information": None,
+            "success": False,
+            "error": f"Not an http(s) URL: {url}",
+            "status_code": None,
+        }
 
-            headings[level].append(title)
+    cache_key = hashlib.sha256(url.encode()).hexdigest()
+    cached_result = _SCRAPE_CACHE.get(cache_key)
+    if cached_result is not None:
+        logger.info(f"Scrape cache hit for URL: {url}")
+        return cached_result
 
-        return {
+    status_code = None
+    try:
+        async with _http.stream("GET", url) as response:
+            status_code = response.status_code
+
+            if status_code != 200:
+                logger.error(f"Failed to harvest URL {url}: {status_code}")
+                return {
+                    "url": url,
+                    "information": None,
+                    "success": False,
+                    "error": f"Failed to harvest URL: {url}",
+                    "status_code": status_code,
+                }
+
+            # Stream the body and bail out once the byte budget is met; the
+            # parser tolerates a truncated document
+            chunks = []
+            downloaded = 0
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                chunks.append(chunk)
+                downloaded += len(chunk)
+                if downloaded >= max_download_bytes:
+                    logger.info(f"Stopping download at {downloaded} bytes for {url}")
+                    break
+        body = b"".join(chunks)
+
+        soup = BeautifulSoup(body, "html.parser")
+        # Collect text fragment by fragment with a character budget so the
+        # full cleaned text is never materialized for long pages; only the
+        # small collected slice gets the whitespace collapse
+        parts = []
+        collected = 0
+        len_original = 0
+        for fragment in soup.stripped_strings:
+            len_original += len(fragment) + 1
+            if collected < max_text_chars:
+                parts.append(fragment)
+                collected += len(fragment) + 1
+        all_text = re.sub(r"\s+", " ", " ".join(parts))[:max_text_chars]
+
+        # Find all headings within the url, using the per-site fast path
+        headings = extract_headings(soup, url)
+
+        result = {
             "url": url,
-            "information": {"all_text": all_text, "headings": headings},
+            "information": {
+                "all_text": all_text,
+                "headings": headings,
+                "len_original": len_original,
+            },
+            "content_hash": compute_content_hash(url, body),
             "success": True,
             "error": None,
-            "status_code": response.status_code,
+            "status_code": status_code,
         }
+        # Only successful scrapes are cached so failures get retried
+        _SCRAPE_CACHE[cache_key] = result
+        return result
 
     except Exception as e:
         logger.error(f"Error harvesting URL {url}: {str(e)}")
@@ -93,10 +255,35 @@ async def scrape_url(url: str) -> dict:
             "information": None,
             "success": False,
             "error": str(e),
-            "status_code": response.status_code,
+            "status_code": status_code,
         }
 
 
+# Scrape many URLs concurrently
+async def scrape_urls(urls: list, concurrency: int = 16) -> list:
+    """
+    Scrape multiple URLs concurrently with a bounded semaphore.
+
+    Network round trips overlap instead of running back to back, so a
+    batch completes in roughly the time of its slowest page rather than
+    the sum of all of them.
+
+    Args:
+        urls (list): The URLs to scrape
+        concurrency (int): Maximum number of in-flight scrapes
+
+    Returns:
+        list: One scrape_url result dict per URL, in input order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def scrape_one(url: str) -> dict:
+        async with semaphore:
+            return await scrape_url(url)
+
+    return await asyncio.gather(*[scrape_one(url) for url in urls])
+
+
 # Query to LLM to identify the relevant information based on the text
 async def vectorize_and_store_web_content(scrape_result: dict, tenant_id: UUID) -> dict:
     """
@@ -105,6 +292,39 @@ async def vectorize_and_store_web_content(scrape_result: dict, tenant_id: UUID)
     """
     logger.info("Starting information identification")
 
+    # Check the content-hash cache first: if this exact page was already
+    # processed, reuse the stored LLM output and skip the LLM + Qdrant work
+    content_hash = scrape_result.get("content_hash")
+    if content_hash:
+        cached_content = await MongoDBManager.get_content_by_hash(
+            content_hash, tenant_id
+        )
+        if cached_content and cached_content.llm_cleaned_content:
+            logger.info(f"Content hash cache hit for URL: {scrape_result['url']}")
+            return {
+                "success": True,
+                "information": cached_content.llm_cleaned_content,
+                "storage_success": True,
+                "cached": True,
+                "error": None,
+            }
+
+    limited_text = scrape_result["information"]["all_text"][:TEXT_LIMIT]
+
+    # Near-duplicate pages (same content under a different URL, trivial
+    # edits) can still reuse an LLM response via embedding similarity; a
+    # hit only skips the LLM call — this document still gets its own
+    # Mongo and Qdrant writes below
+    semantic_cache = None
+    cached_llm_response = None
+    try:
+        semantic_cache = SemanticCache(tenant_id=tenant_id)
+        cached_llm_response = await semantic_cache.get(limited_text)
+        if cached_llm_response:
+            logger.info(f"Semantic cache hit for URL: {scrape_result['url']}")
+    except Exception as e:
+        logger.warning(f"Semantic cache lookup failed: {e}")
+
     # Prepare and store vectors in Qdrant
     processor = ContentProcessor(tenant_id=tenant_id)
     collected_headings = {}
@@ -118,56 +338,58 @@ async def vectorize_and_store_web_content(scrape_result: dict, tenant_id: UUID)
             if len(collected_headings) >= HEADING_LIMIT:
                 break
 
-    # Get query text from headings or URL
-    query_text = ""
-    if collected_headings.get("h1") and collected_headings["h1"]:
-        query_text = collected_headings["h1"][0]
-    elif scrape_result["url"]:
-        query_text = scrape_result["url"]
-
-    # Get relevant context if we have a query
-    relevant_context = ""
-    if query_text:
-        relevant_context = await get_relevant_context(query_text, tenant_id)
-
-    # Get prompts with relevant context
-    system_prompt, user_prompt = get_prompts(
-        headings_subset=collected_headings,
-        limited_text=scrape_result["information"]["all_text"][:TEXT_LIMIT],
-        output_context=relevant_context["output_context"],
-        input_context=relevant_context["input_context"],
-    )
+    cleaned_llm_response = cached_llm_response
+    if cleaned_llm_response is None:
+        # Get query text from headings or URL
+        query_text = ""
+        if collected_headings.get("h1") and collected_headings["h1"]:
+            query_text = collected_headings["h1"][0]
+        elif scrape_result["url"]:
+            query_text = scrape_result["url"]
+
+        # Get relevant context if we have a query
+        relevant_context = ""
+        if query_text:
+            relevant_context = await get_relevant_context(query_text, tenant_id)
+
+        # Get prompts with relevant context
+        system_prompt, user_prompt = get_prompts(
+            headings_subset=collected_headings,
+            limited_text=limited_text,
+            output_context=relevant_context["output_context"],
+            input_context=relevant_context["input_context"],
+        )
 
-    logger.info(f"System prompt: {system_prompt}")
-    logger.info(f"User prompt: {user_prompt}")
+        logger.info(f"System prompt: {system_prompt}")
+        logger.info(f"User prompt: {user_prompt}")
 
-    messages = [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": user_prompt},
-    ]
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
-    # Call OpenAI API
-    response = call_openai_api(messages)
-    if "success" not in response or not response["success"]:
-        return response
+        # Call OpenAI API
+        response = call_openai_api(messages)
+        if "success" not in response or not response["success"]:
+            return response
 
-    # Clean the LLM response
-    llm_response = response["llm_response"]["choices"][0]["message"]["content"]
-    logger.info(f"LLM response: {llm_response}")
-    cleaned_llm_response = (
-        llm_response.replace("```json", "").replace("```", "").strip()
-    )
-    try:
-        cleaned_llm_response = json.loads(cleaned_llm_response)
-    except json.JSONDecodeError as e:
-        logger.error(f"Error parsing LLM response as JSON: {str(e)}")
-        return {
-            "success": False,
-            "information": None,
-            "storage_success": False,
-            "error": f"Error parsing LLM response as JSON: {str(e)}",
-        }
-    logger.info(f"Cleaned LLM response: {cleaned_llm_response}")
+        # Clean the LLM response
+        llm_response = response["llm_response"]["choices"][0]["message"]["content"]
+        logger.info(f"LLM response: {llm_response}")
+        cleaned_llm_response = (
+            llm_response.replace("```json", "").replace("```", "").strip()
+        )
+        try:
+            cleaned_llm_response = orjson.loads(cleaned_llm_response)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Error parsing LLM response as JSON: {str(e)}")
+            return {
+                "success": False,
+                "information": None,
+                "storage_success": False,
+                "error": f"Error parsing LLM response as JSON: {str(e)}",
+            }
+        logger.info(f"Cleaned LLM response: {cleaned_llm_response}")
 
     # Store result in MongoDB
     mongo_result_response = await store_result_in_mongodb(
@@ -180,7 +402,7 @@ async def vectorize_and_store_web_content(scrape_result: dict, tenant_id: UUID)
     processor.add_payload(
         content={
             "cleaned_llm_response": cleaned_llm_response,
-            "input_text": scrape_result["information"]["all_text"][:TEXT_LIMIT],
+            "input_text": limited_text,
             "input_headings": collected_headings,
             "mongo_id": str(mongo_result_response["mongo_result"].id),
         },
@@ -200,6 +422,14 @@ async def vectorize_and_store_web_content(scrape_result: dict, tenant_id: UUID)
             "error": qdrant_response["error"],
         }
 
+    # Only cache once both stores have succeeded, so a storage failure is
+    # never masked by a cache hit on retry
+    if semantic_cache and cached_llm_response is None:
+        try:
+            await semantic_cache.put(limited_text, cleaned_llm_response)
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
+
     return {
         "success": True,
         "information": cleaned_llm_response,
@@ -208,6 +438,64 @@ async def vectorize_and_store_web_content(scrape_result: dict, tenant_id: UUID)
     }
 
 
+# Summarize several scraped pages per LLM request
+async def identify_information_batch(
+    scrape_results: list, batch_size: int = LLM_BATCH_SIZE
+) -> dict:
+    """
+    Identify relevant information for several scraped pages at once.
+
+    Packs up to batch_size documents into a single prompt keyed by URL,
+    amortizing the fixed per-request network and queueing overhead across
+    the pack instead of paying it once per page.
+
+    Args:
+        scrape_results (list): Successful scrape_url result dicts
+        batch_size (int): Number of documents packed per LLM request
+
+    Returns:
+        dict: Mapping of URL to the cleaned LLM result (None on failure)
+    """
+    pages = [
+        {
+            "url": scrape_result["url"],
+            "limited_text": scrape_result["information"]["all_text"][:TEXT_LIMIT],
+            "headings_subset": scrape_result["information"]["headings"],
+        }
+        for scrape_result in scrape_results
+        if scrape_result.get("success")
+    ]
+
+    results = {}
+    for start in range(0, len(pages), batch_size):
+        pack = pages[start : start + batch_size]
+        system_prompt, user_prompt = get_batch_prompts(pack)
+
+        response = call_openai_api(
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ]
+        )
+        if "success" not in response or not response["success"]:
+            results.update({page["url"]: None for page in pack})
+            continue
+
+        llm_response = response["llm_response"]["choices"][0]["message"]["content"]
+        try:
+            parsed = orjson.loads(
+                llm_response.replace("```json", "").replace("```", "").strip()
+            )
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Error parsing batch LLM response as JSON: {str(e)}")
+            parsed = {}
+
+        for page in pack:
+            results[page["url"]] = parsed.get(page["url"])
+
+    return results
+
+
 # Retrieve context from Qdrant
 async def get_relevant_context(
     query: str,
@@ -229,11 +517,19 @@ async def get_relevant_context(
     try:
         if not qdrant_client:
             qdrant_client = QdrantVectorStore(tenant_id=tenant_id)
-        search_results = qdrant_client.search_data_in_qdrant(
+        search_results = await qdrant_client.search_data_in_qdrant(
             collection_name=collection_name,
             query=query,
             tenant_id=tenant_id,
             limit=3,  # Limit to top 3 most relevant results
+            # Only the fields the context builder reads; notably excludes
+            # the large content.input_text blob
+            payload_fields=[
+                "url",
+                "timestamp",
+                "content.cleaned_llm_response",
+                "content.input_headings",
+            ],
         )
 
         if not search_results:
@@ -252,12 +548,16 @@ async def get_relevant_context(
             if "content" in payload and isinstance(payload["content"], dict):
                 if "cleaned_llm_response" in payload["content"]:
                     content = payload["content"]["cleaned_llm_response"]
-                    output_context.append(json.dumps({f"Document {i+1}": content}))
+                    output_context.append(
+                        orjson.dumps({f"Document {i+1}": content}).decode()
+                    )
                 else:
                     logger.warning(f"Unexpected payload structure for Document {i+1}")
                 if "input_headings" in payload["content"]:
                     headings = payload["content"]["input_headings"]
-                    input_context.append(json.dumps({f"Document {i+1}": headings}))
+                    input_context.append(
+                        orjson.dumps({f"Document {i+1}": headings}).decode()
+                    )
                 else:
                     logger.warning(f"Unexpected payload structure for Document {i+1}")
             else:
@@ -279,9 +579,12 @@ def call_openai_api(messages: list) -> dict:
     """
     try:
         logger.info("Sending request to OpenAI...")
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=messages,
+            # JSON mode constrains decoding to valid JSON, so no retries
+            # or fence-stripping are needed on well-behaved responses
+            response_format=JSON_RESPONSE_FORMAT,
             timeout=30,
         )
         return {
@@ -313,6 +616,7 @@ async def store_result_in_mongodb(
             llm_cleaned_content=cleaned_llm_response,
             metadata=None,
             tenant_id=tenant_id,
+            content_hash=scrape_result.get("content_hash"),
         )
         logger.info(f"Successfully stored result in MongoDB: {mongo_result.id}")
         return {"success": True, "mongo_result": mongo_result}
@@ -354,9 +658,12 @@ async def add_payload_and_store_in_qdrant(
         if not qdrant_client:
             qdrant_client = QdrantVectorStore(tenant_id=tenant_id)
 
-        vector_payloads = processor.get_payloads()
-        result = qdrant_client.insert_data_to_qdrant(
-            vector_payloads=vector_payloads, collection_name=collection_name
+        # Stack the embeddings into one contiguous matrix; the SoA upload
+        # path serializes it directly instead of per-float Python objects
+        result = qdrant_client.insert_vectors(
+            collection_name=collection_name,
+            vectors=np.stack([vp.vector for vp in processor.vector_payloads]),
+            payloads=[vp.payload for vp in processor.vector_payloads],
         )
 
         logger.info(f"Successfully stored information in Qdrant: {result}")
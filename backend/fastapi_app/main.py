@@ -18,26 +18,39 @@ from backend.content.content_processor import (
 )
 from backend.models.mongo.db_init import init_mongodb
 from backend.models.mongo.db_manager import MongoDBManager
+from backend.models.rag.qdrant import QdrantVectorStore
+from backend.services.embedding_utils import get_embedding_async
 
 load_dotenv()
 
 MONGODB_URL = os.getenv("MONGODB_URL")
 DATABASE_NAME = os.getenv("DATABASE_NAME")
 
-app = FastAPI()
-
 
 @asynccontextmanager
 async def lifespan(fastapi_app: FastAPI):
     """Lifecycle manager for FastAPI app"""
     await init_mongodb(MONGODB_URL, DATABASE_NAME)
     logger.info("MongoDB connection initialized")
+    try:
+        # Collection and index creation are idempotent and tenant-agnostic
+        vector_store = QdrantVectorStore(tenant_id=UUID(int=0))
+        vector_store.ensure_collection("web_content")
+        vector_store.ensure_indexes("web_content")
+    except Exception as e:
+        logger.warning(f"Could not ensure Qdrant collection setup: {e}")
+    try:
+        # Cheap warmup call so the first real request doesn't pay DNS +
+        # TLS setup towards OpenAI
+        await get_embedding_async("warmup")
+        logger.info("OpenAI connection warmed up")
+    except Exception as e:
+        logger.warning(f"OpenAI warmup call failed: {e}")
     yield
     logger.info("Shutting down MongoDB connection")
     await MongoDBManager.close_mongodb()
 
 
-# Update the original app declaration with lifespan
 app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
@@ -68,7 +81,7 @@ async def harvest_endpoint(tenant_id: UUID, url: str = Form(...)):
 
         if not scrape_result["success"]:
             return {
-                "content":  {
+                "content": {
                     "information": scrape_result["information"],
                     "success": scrape_result["success"],
                     "error": scrape_result["error"],
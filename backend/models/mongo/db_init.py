@@ -3,7 +3,6 @@ This file contains the initialization code for MongoDB connection using Beanie.
 """
 
 from beanie import init_beanie
-from motor.motor_asyncio import AsyncIOMotorClient
 
 from backend.models.mongo.db_manager import MongoDBManager
 from backend.models.mongo.web_content import WebContent
@@ -17,9 +16,10 @@ async def init_mongodb(mongodb_url: str, database_name: str):
         mongodb_url: MongoDB connection URL
         database_name: Name of the database to use
     """
-    # Create Motor client
-    client = AsyncIOMotorClient(mongodb_url)
-    MongoDBManager.set_client(client)
+    # The manager owns the process-wide client (pool size and write
+    # concern are configured there); calling it here just materializes it
+    # on this event loop before Beanie binds to it
+    client = MongoDBManager.get_client(mongodb_url)
 
     # Initialize Beanie with the MongoDB client
     await init_beanie(
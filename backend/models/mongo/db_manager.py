@@ -2,13 +2,15 @@
 This file contains the MongoDB models and operations using Beanie ODM.
 """
 
+import os
+import threading
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from loguru import logger
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 
-from backend.models.mongo.web_content import WebContent
+from backend.models.mongo.web_content import WebContent, WebContentSummary
 
 
 class MongoDBManager:
@@ -16,10 +18,40 @@ class MongoDBManager:
     Manager class for MongoDB operations.
     """
 
-    _client: Optional[AsyncIOMotorClient] = None
+    _client: Optional[AsyncMongoClient] = None
+    _client_lock = threading.Lock()
 
     @classmethod
-    def set_client(cls, client: AsyncIOMotorClient) -> None:
+    def get_client(cls, mongodb_url: Optional[str] = None) -> AsyncMongoClient:
+        """
+        Return the process-wide MongoDB client, creating it lazily.
+
+        Each client carries its own connection pool and monitoring threads,
+        so exactly one is created per process; the lock guards against
+        concurrent first calls racing the creation.
+
+        Args:
+            mongodb_url: Connection URL; falls back to the MONGODB_URL env var
+
+        Returns:
+            AsyncMongoClient: The shared client instance
+        """
+        if cls._client is None:
+            with cls._client_lock:
+                if cls._client is None:
+                    logger.info("Creating MongoDB client")
+                    cls._client = AsyncMongoClient(
+                        mongodb_url or os.getenv("MONGODB_URL"),
+                        maxPoolSize=int(os.getenv("MONGO_POOL", "200")),
+                        minPoolSize=10,
+                        maxIdleTimeMS=60000,
+                        w=int(os.getenv("MONGO_W", "1")),
+                        journal=False,
+                    )
+        return cls._client
+
+    @classmethod
+    def set_client(cls, client: AsyncMongoClient) -> None:
         """Set the MongoDB client instance"""
         logger.info("Setting MongoDB client")
         cls._client = client
@@ -29,7 +61,7 @@ class MongoDBManager:
         """Close the MongoDB connection"""
         if cls._client is not None:
             logger.info("Closing MongoDB connection")
-            cls._client.close()
+            await cls._client.close()
             cls._client = None
 
     @staticmethod
@@ -40,6 +72,7 @@ class MongoDBManager:
         headings: Dict[str, Any],
         llm_cleaned_content: Dict[str, Any] | None = None,
         metadata: Dict[str, Any] | None = None,
+        content_hash: str | None = None,
     ) -> WebContent:
         """
         Insert web content into MongoDB.
@@ -50,6 +83,7 @@ class MongoDBManager:
             headings: List of headings from the page
             llm_response: Raw LLM response and metadata
             tenant_id: Optional tenant ID for multi-tenancy
+            content_hash: Optional hash of the URL and raw content for caching
 
         Returns:
             WebContent: Created document instance
@@ -61,15 +95,84 @@ class MongoDBManager:
             headings=headings,
             llm_cleaned_content=llm_cleaned_content,
             metadata=metadata,
+            content_hash=content_hash,
         )
         return await content.insert()
 
+    @staticmethod
+    async def insert_web_content_bulk(
+        items: List[Dict[str, Any]], tenant_id: UUID | None = None
+    ) -> List[WebContent]:
+        """
+        Insert multiple web content documents in a single round trip.
+
+        Args:
+            items: List of keyword-argument dicts, one per WebContent document
+            tenant_id: Optional tenant applied to items that don't carry one
+
+        Returns:
+            List[WebContent]: The constructed document instances
+        """
+        if tenant_id is not None:
+            items = [{"tenant_id": tenant_id, **item} for item in items]
+        docs = [WebContent(**item) for item in items]
+        # ordered=False lets the rest of the batch land even if one
+        # document fails (e.g. a duplicate content_hash)
+        await WebContent.insert_many(docs, ordered=False)
+        return docs
+
+    @staticmethod
+    async def get_content_by_hash(
+        content_hash: str, tenant_id: UUID
+    ) -> Optional[WebContent]:
+        """
+        Retrieve a tenant's content by its content hash.
+
+        Scoped to the tenant so one tenant's hash-cache hit can never
+        serve another tenant's document.
+
+        Args:
+            content_hash: Hash of the URL and raw page content
+            tenant_id: Tenant whose documents to search
+
+        Returns:
+            Optional[WebContent]: The cached document, if any
+        """
+        return await WebContent.find_one(
+            WebContent.content_hash == content_hash,
+            WebContent.tenant_id == tenant_id,
+        )
+
     @staticmethod
     async def get_content_by_url_and_tenant_id(
         url: str, tenant_id: UUID
+    ) -> List[WebContentSummary]:
+        """
+        Retrieve content summaries by URL.
+
+        Projects only id, url, tenant_id and created_at so the query stays
+        on the (tenant_id, url) index and skips the large text blobs.
+
+        Args:
+            url: URL to search for
+
+        Returns:
+            List[WebContentSummary]: Summaries of found documents
+        """
+        return (
+            await WebContent.find(
+                WebContent.url == url, WebContent.tenant_id == tenant_id
+            )
+            .project(WebContentSummary)
+            .to_list()
+        )
+
+    @staticmethod
+    async def get_full_content_by_url_and_tenant_id(
+        url: str, tenant_id: UUID
     ) -> List[WebContent]:
         """
-        Retrieve content by URL.
+        Retrieve full content documents by URL.
 
         Args:
             url: URL to search for
@@ -1,9 +1,10 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict
 from uuid import UUID
 
-from beanie import Document
-from pydantic import Field
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, Field
+from pymongo import IndexModel
 
 
 class WebContent(Document):
@@ -23,8 +24,11 @@ class WebContent(Document):
     llm_cleaned_content: Dict[str, Any] | None = Field(
         default_factory=dict, description="Processed and structured content from LLM"
     )
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    content_hash: str | None = Field(
+        default=None, description="Hash of the URL and raw page content for caching"
+    )
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     class Settings:
         """
@@ -33,3 +37,32 @@ class WebContent(Document):
 
         name = "web_content"
         use_state_management = True
+        indexes = [
+            # Also serves the projected lookups in MongoDBManager, keeping
+            # them index-backed without touching the large text fields
+            IndexModel([("tenant_id", 1), ("url", 1)], name="tenant_id_url"),
+            IndexModel(
+                # Scoped per tenant: the same page harvested by two tenants
+                # is two legitimate documents, and hash-cache lookups must
+                # never leak another tenant's copy
+                [("tenant_id", 1), ("content_hash", 1)],
+                name="tenant_id_content_hash_unique",
+                unique=True,
+                # Only index documents that actually carry a hash so legacy
+                # documents with a null content_hash don't collide
+                partialFilterExpression={"content_hash": {"$type": "string"}},
+            ),
+            IndexModel([("created_at", -1)], name="created_at_desc"),
+        ]
+
+
+class WebContentSummary(BaseModel):
+    """
+    Lightweight projection of WebContent for presence/metadata lookups,
+    skipping the large raw_text and llm_cleaned_content blobs.
+    """
+
+    id: PydanticObjectId = Field(alias="_id")
+    tenant_id: UUID
+    url: str
+    created_at: datetime
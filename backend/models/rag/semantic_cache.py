@@ -0,0 +1,104 @@
+"""
+Semantic cache backed by a dedicated Qdrant collection.
+"""
+
+import time
+from typing import Any, Optional
+from uuid import UUID
+
+from loguru import logger
+from qdrant_client import models
+
+from backend.models.rag.qdrant import QdrantVectorStore
+from backend.services.embedding_utils import get_embedding_async
+
+SEMANTIC_CACHE_COLLECTION = "semantic_cache"
+SIMILARITY_THRESHOLD = 0.95
+DEFAULT_TTL_SECONDS = 3600
+
+
+class SemanticCache:
+    """
+    Near-duplicate response cache.
+
+    Texts are embedded once and looked up by cosine similarity, so inputs
+    that differ only in phrasing or whitespace reuse the stored response
+    instead of paying another LLM round trip. Entries expire via an
+    expires_at payload filter rather than explicit deletion.
+    """
+
+    def __init__(
+        self,
+        tenant_id: UUID,
+        score_threshold: float = SIMILARITY_THRESHOLD,
+        ttl: int = DEFAULT_TTL_SECONDS,
+    ):
+        """
+        Initialize the cache for a tenant
+
+        Args:
+            tenant_id: Identifier for the organization/tenant
+            score_threshold: Minimum cosine similarity for a hit
+            ttl: Entry lifetime in seconds
+        """
+        self.tenant_id = tenant_id
+        self.score_threshold = score_threshold
+        self.ttl = ttl
+        self.store = QdrantVectorStore(tenant_id=tenant_id)
+        self.store.ensure_collection(SEMANTIC_CACHE_COLLECTION)
+
+    async def get(self, text: str) -> Optional[Any]:
+        """
+        Look up a cached response for a semantically equivalent text
+
+        Args:
+            text (str): The input text to match against cached entries
+
+        Returns:
+            Optional[Any]: The cached response, or None on a miss
+        """
+        query_vector = await get_embedding_async(text)
+        response = self.store.client.query_points(
+            collection_name=SEMANTIC_CACHE_COLLECTION,
+            query=query_vector,
+            limit=1,
+            score_threshold=self.score_threshold,
+            query_filter=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key="tenant_id",
+                        match=models.MatchValue(value=str(self.tenant_id)),
+                    ),
+                    models.FieldCondition(
+                        key="expires_at", range=models.Range(gt=time.time())
+                    ),
+                ]
+            ),
+            with_payload=True,
+        )
+        if not response.points:
+            return None
+        logger.info("Semantic cache hit")
+        return response.points[0].payload.get("response")
+
+    async def put(self, text: str, response: Any) -> None:
+        """
+        Store a response keyed by the text's embedding
+
+        Args:
+            text (str): The input text to key on
+            response (Any): The response to cache
+        """
+        vector = await get_embedding_async(text)
+        self.store.insert_data_to_qdrant(
+            [
+                {
+                    "vector": vector,
+                    "payload": {
+                        "response": response,
+                        "expires_at": time.time() + self.ttl,
+                    },
+                }
+            ],
+            SEMANTIC_CACHE_COLLECTION,
+        )
@@ -2,17 +2,58 @@
 Utility functions for generating and working with embeddings.
 """
 
+import hashlib
 import os
+from functools import lru_cache
 from typing import List
 
+import httpx
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from openai.types.create_embedding_response import CreateEmbeddingResponse
 
 load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def get_client() -> OpenAI:
+    """
+    Process-wide sync OpenAI client, constructed on first use
+
+    Deferring construction keeps import of this module cheap for code
+    paths that never embed (cold starts, CLI tools).
+    """
+    return OpenAI(api_key=OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def get_async_client() -> AsyncOpenAI:
+    """
+    Process-wide async OpenAI client, constructed on first use
+
+    Carries a keep-alive connection pool so concurrent embedding calls
+    reuse warm connections instead of blocking the event loop behind the
+    sync client.
+    """
+    return AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        http_client=httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        ),
+    )
+
+
+# Embedding vectors keyed by text hash; duplicate texts within the TTL
+# skip the OpenAI round trip entirely
+_EMBEDDING_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+
+def _cache_key(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
 
 
 def get_embedding(text: str) -> List[float]:
@@ -25,8 +66,68 @@ def get_embedding(text: str) -> List[float]:
     Returns:
         List[float]: The embedding vector
     """
-    response: CreateEmbeddingResponse = client.embeddings.create(
+    key = _cache_key(text)
+    cached = _EMBEDDING_CACHE.get(key)
+    if cached is not None:
+        return cached
+    response: CreateEmbeddingResponse = get_client().embeddings.create(
         model="text-embedding-3-small",
         input=text,
     )
-    return response.data[0].embedding
+    embedding = response.data[0].embedding
+    _EMBEDDING_CACHE[key] = embedding
+    return embedding
+
+
+async def get_embedding_async(text: str) -> List[float]:
+    """
+    Get embedding from OpenAI API without blocking the event loop
+
+    Args:
+        text (str): The text to generate an embedding for
+
+    Returns:
+        List[float]: The embedding vector
+    """
+    key = _cache_key(text)
+    cached = _EMBEDDING_CACHE.get(key)
+    if cached is not None:
+        return cached
+    response: CreateEmbeddingResponse = await get_async_client().embeddings.create(
+        model="text-embedding-3-small",
+        input=text,
+    )
+    embedding = response.data[0].embedding
+    _EMBEDDING_CACHE[key] = embedding
+    return embedding
+
+
+def get_embeddings_batch(texts: List[str]) -> List[List[float]]:
+    """
+    Get embeddings for multiple texts in a single OpenAI request
+
+    Args:
+        texts (List[str]): The texts to generate embeddings for
+
+    Returns:
+        List[List[float]]: One embedding vector per input text, in order
+    """
+    if not texts:
+        return []
+    keys = [_cache_key(text) for text in texts]
+    results: List = [_EMBEDDING_CACHE.get(key) for key in keys]
+
+    # Only embed the texts that missed the cache
+    miss_indexes = [i for i, embedding in enumerate(results) if embedding is None]
+    if miss_indexes:
+        response: CreateEmbeddingResponse = get_client().embeddings.create(
+            model="text-embedding-3-small",
+            input=[texts[i] for i in miss_indexes],
+        )
+        # The API may return items out of order; item.index maps back to
+        # the position in the miss list
+        for item in response.data:
+            i = miss_indexes[item.index]
+            results[i] = item.embedding
+            _EMBEDDING_CACHE[keys[i]] = item.embedding
+    return results
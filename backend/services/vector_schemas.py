@@ -6,19 +6,31 @@ from datetime import datetime
 from typing import Any, Dict, List
 from uuid import UUID
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator
 
-from backend.services.embedding_utils import get_embedding
+from backend.services.embedding_utils import get_embedding, get_embeddings_batch
 
 
 class VectorPayload(BaseModel):
     """
     This class is used to store the vector payloads in the format expected by Qdrant.
+
+    Vectors are held as contiguous float16 numpy arrays (~14x smaller than
+    a list of Python floats for a 1536-d embedding) and expanded back to
+    float lists only at the serialization boundary.
     """
 
-    vector: List[float]
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    vector: np.ndarray
     payload: Dict[str, Any]
 
+    @field_validator("vector", mode="before")
+    @classmethod
+    def _compact_vector(cls, value) -> np.ndarray:
+        return np.asarray(value, dtype=np.float16)
+
 
 class ContentProcessor(BaseModel):
     """
@@ -27,6 +39,15 @@ class ContentProcessor(BaseModel):
 
     tenant_id: UUID
     vector_payloads: List[VectorPayload] = []
+    # Timestamp shared by every payload in this batch; computed once at
+    # construction instead of on each add_payload call
+    _now: str = PrivateAttr(default_factory=lambda: datetime.now().isoformat())
+
+    def refresh_now(self) -> None:
+        """
+        Recompute the shared batch timestamp for long-lived processors.
+        """
+        self._now = datetime.now().isoformat()
 
     def add_payload(self, content: dict, url: str) -> None:
         """
@@ -44,11 +65,37 @@ class ContentProcessor(BaseModel):
                 "url": url,
                 "tenant_id": self.tenant_id,
                 "content": content,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._now,
             },
         )
         self.vector_payloads.append(payload)
 
+    def add_payloads_batch(self, contents: List[dict], url: str) -> None:
+        """
+        Add multiple payloads with a single batched embedding request.
+
+        All input texts are embedded in one OpenAI call instead of one
+        round trip per item.
+
+        Args:
+            contents (List[dict]): The content dicts to be stored
+            url (str): The source URL shared by the batch
+        """
+        vectors = get_embeddings_batch([content["input_text"] for content in contents])
+
+        for content, vector in zip(contents, vectors):
+            self.vector_payloads.append(
+                VectorPayload(
+                    vector=vector,
+                    payload={
+                        "url": url,
+                        "tenant_id": self.tenant_id,
+                        "content": content,
+                        "timestamp": self._now,
+                    },
+                )
+            )
+
     def get_payloads(self) -> List[Dict[str, Any]]:
         """
         Get the vector payloads in the format expected by Qdrant.
@@ -56,12 +103,15 @@ class ContentProcessor(BaseModel):
         Returns:
             List[Dict[str, Any]]: List of vector payloads
         """
-        # For Pydantic v1
-        try:
-            return [payload.dict() for payload in self.vector_payloads]
-        # For Pydantic v2
-        except AttributeError:
-            return [payload.model_dump() for payload in self.vector_payloads]
+        # Expand the compact float16 vectors back to float lists only here,
+        # at the serialization boundary
+        return [
+            {
+                "vector": payload.vector.astype(np.float32).tolist(),
+                "payload": payload.payload,
+            }
+            for payload in self.vector_payloads
+        ]
 
     def clear_payloads(self) -> None:
         """